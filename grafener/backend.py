@@ -9,6 +9,7 @@ from werkzeug.exceptions import abort
 
 from grafener.logging_config import init_logging
 from grafener.request_handler import get_data, get_metrics
+from grafener.scheduler import SchedulerOverloaded, load_scheduler
 from grafener.source import Source
 
 init_logging()
@@ -60,9 +61,8 @@ def search(xp: str | None = None):
 def query(xp: str | None = None):
     source = _source()
     req = request.get_json()
-    raw_resp = [
-        t.serialize()
-        for t in get_data(
+    try:
+        data = get_data(
             source=source,
             targets=req["targets"],
             response_type=req["targets"][0]["type"],
@@ -70,10 +70,17 @@ def query(xp: str | None = None):
             range_to=req["range"]["to"],
             experiment=xp,
         )
-    ]
+    except SchedulerOverloaded as e:
+        abort(Response(str(e), 503, headers={"Retry-After": str(e.retry_after)}))
+    raw_resp = [t.serialize() for t in data]
     return jsonify(raw_resp)
 
 
+@app.route("/_scheduler/stats", methods=["GET"])
+def scheduler_stats():
+    return jsonify(load_scheduler.stats())
+
+
 @app.route("/annotations", methods=["POST"])
 @app.route("/tag-keys", methods=["POST"])
 @app.route("/tag-values", methods=["POST"])
@@ -6,6 +6,7 @@ from attr import dataclass
 from pandas import DataFrame
 
 from grafener.logging_config import init_logging
+from grafener.scheduler import load_scheduler
 from grafener.source import Source
 
 init_logging()
@@ -100,6 +101,7 @@ def get_data(
     :param experiment: an optional experiment ID passed as path parameter during datasource configuration. When defined,
                        targets have it as a name prefix
     :return:
+    :raise SchedulerOverloaded: if the load can't be admitted by the scheduler
     """
     # remove experiment ID prefix from targets
     xp_free_targets = copy.deepcopy(targets)
@@ -114,23 +116,26 @@ def get_data(
     if available_cols.columns[-1] in use_cols:
         use_cols.append(available_cols.columns[-1] + " ")
         use_cols.remove(available_cols.columns[-1])
-    df = _fetch(source, header_only=False, use_cols=use_cols)
-
-    # filter data with specified time range
-    range_from_dt = datetime.fromisoformat(range_from.replace("Z", "+00:00"))
-    range_to_dt = datetime.fromisoformat(range_to.replace("Z", "+00:00"))
-    df = df[(df.index >= range_from_dt) & (df.index <= range_to_dt)]
-
-    # process each target and transform to requested response type
-    if response_type == "timeserie":
-        resp = [
-            _to_time_series_response(target_definition["target"], df, experiment)
-            for target_definition in xp_free_targets
-        ]
-    elif response_type == "table":
-        resp = [_to_table_response([t["target"] for t in xp_free_targets], df, experiment)]
-    else:
-        raise ValueError(f"unsupported response type {response_type}")
-
-    del df
-    return resp
+    # wait for enough memory budget before parsing source, and until response is built
+    cost = source.estimate_load_size(use_cols)
+    with load_scheduler.admit(cost):
+        df = _fetch(source, header_only=False, use_cols=use_cols)
+
+        # filter data with specified time range
+        range_from_dt = datetime.fromisoformat(range_from.replace("Z", "+00:00"))
+        range_to_dt = datetime.fromisoformat(range_to.replace("Z", "+00:00"))
+        df = df[(df.index >= range_from_dt) & (df.index <= range_to_dt)]
+
+        # process each target and transform to requested response type
+        if response_type == "timeserie":
+            resp = [
+                _to_time_series_response(target_definition["target"], df, experiment)
+                for target_definition in xp_free_targets
+            ]
+        elif response_type == "table":
+            resp = [_to_table_response([t["target"] for t in xp_free_targets], df, experiment)]
+        else:
+            raise ValueError(f"unsupported response type {response_type}")
+
+        del df
+        return resp
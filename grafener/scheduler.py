@@ -0,0 +1,153 @@
+import heapq
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from grafener.logging_config import init_logging
+
+init_logging()
+
+
+class SchedulerOverloaded(Exception):
+    """Raised when a load can't be admitted because memory budget is exhausted."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LoadScheduler:
+    """Admission control for source loads.
+
+    Admitted loads are accounted for with their estimated cost. Heavy loads run concurrently only while their
+    cumulated cost fits in memory budget, others wait in a queue where cheapest loads are served first. Cheap loads
+    (cost under cheap_threshold) skip the queue. When the queue is full or a load waited more than max_wait seconds,
+    SchedulerOverloaded is raised.
+    """
+
+    def __init__(self, memory_budget: int, max_queue_depth: int, max_wait: float, cheap_threshold: int):
+        self.memory_budget = memory_budget
+        self.max_queue_depth = max_queue_depth
+        self.max_wait = max_wait
+        self.cheap_threshold = cheap_threshold
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._in_flight = 0
+        self._in_flight_cost = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+        self._completed = 0
+        self._total_hold = 0.0
+
+    @staticmethod
+    def from_env() -> "LoadScheduler":
+        """Build a scheduler configured from environment variables."""
+        return LoadScheduler(
+            memory_budget=int(float(os.getenv("LOAD_MEMORY_BUDGET_MB", 2048)) * 1024 * 1024),
+            max_queue_depth=int(os.getenv("LOAD_MAX_QUEUE_DEPTH", 16)),
+            max_wait=float(os.getenv("LOAD_MAX_WAIT_S", 30)),
+            cheap_threshold=int(float(os.getenv("LOAD_CHEAP_THRESHOLD_MB", 16)) * 1024 * 1024),
+        )
+
+    @contextmanager
+    def admit(self, cost: int) -> Iterator[None]:
+        """Holds a slot for a load of given cost for the duration of the context.
+
+        :param cost: estimated cost of the load, in bytes
+        :raise SchedulerOverloaded: if load can't be admitted
+        """
+        self._acquire(cost)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(cost, time.monotonic() - start)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        :return: current state of the scheduler
+        """
+        with self._cond:
+            return {
+                "memory_budget": self.memory_budget,
+                "in_flight": self._in_flight,
+                "in_flight_cost": self._in_flight_cost,
+                "queue_depth": len(self._waiting),
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "queued": self._waited,
+                "wait_time_total": self._total_wait,
+                "wait_time_mean": self._total_wait / self._waited if self._waited else 0.0,
+                "wait_time_max": self._max_wait_seen,
+            }
+
+    def _fits(self, cost: int) -> bool:
+        # a load bigger than the whole budget is still allowed to run alone
+        return self._in_flight == 0 or self._in_flight_cost + cost <= self.memory_budget
+
+    def _retry_after(self) -> int:
+        mean_hold = self._total_hold / self._completed if self._completed else 1.0
+        return max(1, math.ceil(mean_hold))
+
+    def _overloaded(self, reason: str) -> SchedulerOverloaded:
+        self._rejected += 1
+        logging.warning(f"load rejected: {reason} - {self._in_flight} loads in flight, {len(self._waiting)} queued")
+        return SchedulerOverloaded(f"server overloaded: {reason}", retry_after=self._retry_after())
+
+    def _acquire(self, cost: int) -> None:
+        with self._cond:
+            if cost <= self.cheap_threshold or (not self._waiting and self._fits(cost)):
+                self._start(cost)
+                return
+            if len(self._waiting) >= self.max_queue_depth:
+                raise self._overloaded("load queue is full")
+
+            ticket = (cost, next(self._tickets))
+            heapq.heappush(self._waiting, ticket)
+            enqueued_at = time.monotonic()
+            deadline = enqueued_at + self.max_wait
+            try:
+                while not (self._waiting[0] == ticket and self._fits(cost)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._overloaded(f"load waited more than {self.max_wait}s")
+                    self._cond.wait(remaining)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+
+            waited = time.monotonic() - enqueued_at
+            self._waited += 1
+            self._total_wait += waited
+            self._max_wait_seen = max(self._max_wait_seen, waited)
+            self._start(cost)
+            # next load in queue may fit as well
+            self._cond.notify_all()
+
+    def _start(self, cost: int) -> None:
+        self._in_flight += 1
+        self._in_flight_cost += cost
+        self._admitted += 1
+
+    def _release(self, cost: int, held: float) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._in_flight_cost -= cost
+            self._completed += 1
+            self._total_hold += held
+            self._cond.notify_all()
+
+
+load_scheduler = LoadScheduler.from_env()
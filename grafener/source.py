@@ -14,6 +14,18 @@ from grafener.energyplus import process_csv
 for logger in ["boto3", "botocore", "s3transfer", "urllib3"]:
     logging.getLogger(logger).setLevel(logging.ERROR)
 
+# rough ratio between in-memory DataFrame footprint (parsed floats, datetime index, intermediate copies) and on-disk
+# size of the file being parsed
+CSV_EXPANSION_FACTOR = 3.0
+GZIP_EXPANSION_FACTOR = 30.0
+
+
+def _estimate_file_load_size(file_path: str, file_size: int, requested_cols: int, total_cols: int) -> int:
+    """Scales file size by its expansion factor and by the share of columns requested."""
+    factor = GZIP_EXPANSION_FACTOR if file_path.endswith(".gz") else CSV_EXPANSION_FACTOR
+    ratio = min(1.0, requested_cols / total_cols) if total_cols else 1.0
+    return int(file_size * factor * ratio)
+
 
 class Source(ABC):
     """An abstract source."""
@@ -22,31 +34,31 @@ class Source(ABC):
         self.source_path = source_path
         self.sim_year = sim_year
 
+    @abstractmethod
     def read_source(self, header_only: bool, use_cols: list[str] | None) -> DataFrame:
         """Read source and apply necessary transformations.
 
         :param header_only: read only the header, useful to get column names
         :param use_cols: columns to read. Must be provided if header_only is False
         """
+        pass
 
-        if header_only:
-            # read only the header
-            cols_df = pd.read_csv(self.load(), nrows=0)
-            cols_df.columns = [col.strip() for col in cols_df.columns]
-            return cols_df
-        else:
-            assert use_cols, "use_cols must be provided"
-            # make sure Date/Time is always present, as it's used as index
-            if "Date/Time" not in use_cols:
-                use_cols.append("Date/Time")
-            # read and process the whole file
-            return process_csv(pd.read_csv(self.load(), usecols=use_cols), sim_year=self.sim_year)
+    @abstractmethod
+    def estimate_load_size(self, use_cols: list[str]) -> int:
+        """Estimates memory needed to load and process given columns of this source.
+
+        :param use_cols: columns to read
+        :return: estimated size, in bytes
+        """
+        pass
 
     @staticmethod
     def of(source_path: str, sim_year: int):
         """Build a source from given path."""
         if source_path.startswith("s3://"):
             return S3Source(source_path, sim_year)
+        elif os.path.isdir(source_path):
+            return DirectorySource(source_path, sim_year)
         else:
             return LocalFilesystemSource(source_path, sim_year)
 
@@ -57,6 +69,48 @@ class Source(ABC):
         """
         pass
 
+    @abstractmethod
+    def source_size(self) -> int:
+        """
+        :return: size of source, in bytes
+        """
+        pass
+
+
+class FileSource(Source):
+    """An abstract source backed by a single CSV file."""
+
+    def __init__(self, source_path: str, sim_year: int):
+        super().__init__(source_path, sim_year)
+        # number of columns in file header, known once header was read
+        self._header_width: int | None = None
+
+    def read_source(self, header_only: bool, use_cols: list[str] | None) -> DataFrame:
+        """Read source and apply necessary transformations.
+
+        :param header_only: read only the header, useful to get column names
+        :param use_cols: columns to read. Must be provided if header_only is False
+        """
+
+        if header_only:
+            # read only the header
+            cols_df = pd.read_csv(self.load(), nrows=0)
+            cols_df.columns = [col.strip() for col in cols_df.columns]
+            self._header_width = len(cols_df.columns)
+            return cols_df
+        else:
+            assert use_cols, "use_cols must be provided"
+            # make sure Date/Time is always present, as it's used as index
+            if "Date/Time" not in use_cols:
+                use_cols.append("Date/Time")
+            # read and process the whole file
+            return process_csv(pd.read_csv(self.load(), usecols=use_cols), sim_year=self.sim_year)
+
+    def estimate_load_size(self, use_cols: list[str]) -> int:
+        if self._header_width is None:
+            self.read_source(header_only=True, use_cols=None)
+        return _estimate_file_load_size(self.source_path, self.source_size(), len(use_cols), self._header_width)
+
     @abstractmethod
     def load(self) -> str:
         """Load source and store it on local filesystem.
@@ -66,7 +120,7 @@ class Source(ABC):
         pass
 
 
-class LocalFilesystemSource(Source):
+class LocalFilesystemSource(FileSource):
     """A source from local file."""
 
     def __init__(self, source_path: str, sim_year: int):
@@ -75,11 +129,14 @@ class LocalFilesystemSource(Source):
     def source_timestamp(self) -> int:
         return int(os.path.getmtime(self.source_path))
 
+    def source_size(self) -> int:
+        return os.path.getsize(self.source_path)
+
     def load(self) -> str:
         return self.source_path
 
 
-class S3Source(Source):
+class S3Source(FileSource):
     """A source build from a S3 object.
 
     To use it against a private source, make sure that either:
@@ -98,7 +155,102 @@ class S3Source(Source):
         object_summary = self.s3.ObjectSummary(self.bucket, self.key)
         return int(object_summary.last_modified.timestamp())
 
+    def source_size(self) -> int:
+        return self.s3.ObjectSummary(self.bucket, self.key).size
+
     def load(self) -> str:
         tmp_path = os.path.join(tempfile.gettempdir(), self.key.replace("/", "_"))
         self.s3.Bucket(self.bucket).download_file(self.key, tmp_path)
         return tmp_path
+
+
+class DirectorySource(Source):
+    """A source made of all EnergyPlus CSV outputs (eplusout.csv, eplusmtr.csv, ...) found in a run directory.
+
+    An index of which file holds each column is built at creation, reading only file headers. Files without a
+    Date/Time column (tabular or sizing reports) are ignored. If a column is found in more than one file, eplusout
+    wins, then files in alphabetical order.
+    """
+
+    def __init__(self, source_path: str, sim_year: int):
+        super().__init__(source_path, sim_year)
+        self.files = self._list_files()
+        # stripped column name -> (file path, column name as found in file header)
+        self.columns_index: dict[str, tuple[str, str]] = {}
+        # file path -> number of columns in file header
+        self.files_width: dict[str, int] = {}
+        for file in self.files:
+            header = self._read_header(file)
+            self.files_width[file] = len(header)
+            for col in header:
+                if col.strip() != "Date/Time":
+                    self.columns_index.setdefault(col.strip(), (file, col))
+
+    def _list_files(self) -> list[str]:
+        names = [n for n in os.listdir(self.source_path) if n.endswith(".csv") or n.endswith(".csv.gz")]
+        names = sorted(names, key=lambda n: (not n.startswith("eplusout."), n))
+        return [os.path.join(self.source_path, n) for n in names]
+
+    @staticmethod
+    def _read_header(file: str) -> list[str]:
+        try:
+            cols = list(pd.read_csv(file, nrows=0).columns)
+        # corrupt or partially written gzip files raise BadGzipFile (an OSError) or EOFError
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, OSError, EOFError):
+            logging.warning(f"ignoring unreadable file [{file}]")
+            return []
+        if "Date/Time" not in [c.strip() for c in cols]:
+            logging.debug(f"ignoring file without Date/Time column [{file}]")
+            return []
+        return cols
+
+    def _cols_by_file(self, use_cols: list[str]) -> dict[str, list[str]]:
+        """Groups requested columns by file holding them, so only those files are parsed.
+
+        :return: file path -> column names as found in file header
+        """
+        cols_by_file: dict[str, list[str]] = {}
+        for col in {c.strip() for c in use_cols if c.strip() != "Date/Time"}:
+            if col not in self.columns_index:
+                raise KeyError(f"column [{col}] not found in [{self.source_path}]")
+            file, raw_col = self.columns_index[col]
+            cols_by_file.setdefault(file, []).append(raw_col)
+        return cols_by_file
+
+    def estimate_load_size(self, use_cols: list[str]) -> int:
+        """Sums estimates of files holding given columns, each with its own expansion factor.
+
+        :param use_cols: columns to read
+        :return: estimated size, in bytes
+        """
+        return sum(
+            _estimate_file_load_size(file, os.path.getsize(file), len(cols), self.files_width[file])
+            for file, cols in self._cols_by_file(use_cols).items()
+        )
+
+    def read_source(self, header_only: bool, use_cols: list[str] | None) -> DataFrame:
+        """Read columns from the files holding them, and join them on processed time index.
+
+        :param header_only: read only the header, useful to get column names
+        :param use_cols: columns to read. Must be provided if header_only is False
+        """
+        if header_only:
+            return DataFrame(columns=["Date/Time", *self.columns_index.keys()])
+
+        assert use_cols, "use_cols must be provided"
+        frames = [
+            LocalFilesystemSource(file, self.sim_year)
+            .read_source(header_only=False, use_cols=cols)
+            .drop(columns="Date/Time")
+            for file, cols in self._cols_by_file(use_cols).items()
+        ]
+        if len(frames) == 1:
+            return frames[0]
+        # files may be reported at different frequencies: fill gaps the same way process_csv does
+        return pd.concat(frames, axis=1, join="outer").fillna(0.0).sort_index()
+
+    def source_timestamp(self) -> int:
+        return max((int(os.path.getmtime(f)) for f in self.files), default=int(os.path.getmtime(self.source_path)))
+
+    def source_size(self) -> int:
+        return sum(os.path.getsize(f) for f in self.files)
@@ -1,10 +1,14 @@
 import json
 import math
+import shutil
 import unittest
 from unittest import skipUnless
+from unittest.mock import patch
 
 from grafener.backend import app
 from grafener.request_handler import _fetch  # noqa
+from grafener.scheduler import LoadScheduler
+from tests.test_source import MTR_COL, OUT_COL, make_run_dir
 
 
 def _aws_creds_available():
@@ -205,6 +209,63 @@ class TestBackend(unittest.TestCase):
             self.assertTrue(len(data["rows"]) > 0)
             self.assertEqual(3, len(data["rows"][0]))
 
+    def test_directory_source(self):
+        run_dir = make_run_dir()
+        try:
+            with app.test_client() as client:
+                rv = client.post("/search", headers={"source": run_dir})
+                json_resp = json.loads(rv.data)
+                self.assertIn(OUT_COL, json_resp)
+                self.assertIn(MTR_COL, json_resp)
+
+                rv = client.post(
+                    "/query",
+                    data=json.dumps(
+                        {
+                            "range": {
+                                "from": "2020-01-01T00:00:00.000Z",
+                                "to": "2020-01-02T00:00:00.000Z",
+                            },
+                            "targets": [{"target": OUT_COL, "type": "table"}, {"target": MTR_COL, "type": "table"}],
+                        }
+                    ),
+                    headers={"source": run_dir, "sim_year": "2020", "content-type": "application/json"},
+                )
+                json_resp = json.loads(rv.data)
+                self.assertEqual(1, len(json_resp))
+                self.assertEqual([OUT_COL, MTR_COL], [c["text"] for c in json_resp[0]["columns"][1:]])
+                self.assertTrue(len(json_resp[0]["rows"]) > 0)
+        finally:
+            shutil.rmtree(run_dir)
+
+    def test_query_overloaded(self):
+        scheduler = LoadScheduler(memory_budget=1, max_queue_depth=0, max_wait=0, cheap_threshold=0)
+        with patch("grafener.request_handler.load_scheduler", scheduler), scheduler.admit(1):
+            with app.test_client() as client:
+                rv = client.post(
+                    "/query",
+                    data=json.dumps(
+                        {
+                            "range": {
+                                "from": "2020-01-01T00:00:00.000Z",
+                                "to": "2020-02-01T00:00:00.000Z",
+                            },
+                            "targets": [{"target": "Electricity:Facility [J](Hourly)", "type": "timeserie"}],
+                        }
+                    ),
+                    headers={"source": "tests/test_eplusout.csv.gz", "content-type": "application/json"},
+                )
+                self.assertEqual(503, rv.status_code)
+                self.assertEqual("1", rv.headers["Retry-After"])
+
+    def test_scheduler_stats(self):
+        with app.test_client() as client:
+            rv = client.get("/_scheduler/stats")
+            json_resp = json.loads(rv.data)
+            self.assertEqual(200, rv.status_code)
+            self.assertIn("queue_depth", json_resp)
+            self.assertIn("wait_time_mean", json_resp)
+
     @skipUnless(_aws_creds_available(), "AWS credentials not available")
     def test_s3_source(self):
         with app.test_client() as client:
@@ -0,0 +1,77 @@
+import threading
+import time
+import unittest
+
+from grafener.scheduler import LoadScheduler, SchedulerOverloaded
+
+MB = 1024 * 1024
+
+
+def _scheduler(**kwargs) -> LoadScheduler:
+    params = {"memory_budget": 100 * MB, "max_queue_depth": 4, "max_wait": 5.0, "cheap_threshold": 1 * MB}
+    params.update(kwargs)
+    return LoadScheduler(**params)
+
+
+class TestLoadScheduler(unittest.TestCase):
+    def test_admit_within_budget(self):
+        scheduler = _scheduler()
+        with scheduler.admit(40 * MB), scheduler.admit(40 * MB):
+            stats = scheduler.stats()
+            self.assertEqual(2, stats["in_flight"])
+            self.assertEqual(80 * MB, stats["in_flight_cost"])
+        stats = scheduler.stats()
+        self.assertEqual(0, stats["in_flight"])
+        self.assertEqual(0, stats["in_flight_cost"])
+        self.assertEqual(2, stats["admitted"])
+
+    def test_load_bigger_than_budget_runs_alone(self):
+        scheduler = _scheduler()
+        with scheduler.admit(500 * MB):
+            self.assertEqual(1, scheduler.stats()["in_flight"])
+
+    def test_cheap_load_skips_queue(self):
+        scheduler = _scheduler(max_queue_depth=0)
+        with scheduler.admit(90 * MB), scheduler.admit(MB // 2):
+            self.assertEqual(2, scheduler.stats()["in_flight"])
+
+    def test_fast_fail_when_queue_full(self):
+        scheduler = _scheduler(max_queue_depth=0)
+        with scheduler.admit(90 * MB):
+            with self.assertRaises(SchedulerOverloaded) as ctx:
+                with scheduler.admit(20 * MB):
+                    pass
+            self.assertGreaterEqual(ctx.exception.retry_after, 1)
+        self.assertEqual(1, scheduler.stats()["rejected"])
+
+    def test_fail_after_max_wait(self):
+        scheduler = _scheduler(max_wait=0.05)
+        with scheduler.admit(90 * MB):
+            with self.assertRaises(SchedulerOverloaded):
+                with scheduler.admit(20 * MB):
+                    pass
+            self.assertEqual(0, scheduler.stats()["queue_depth"])
+
+    def test_queued_loads_served_cheapest_first(self):
+        scheduler = _scheduler()
+        order = []
+
+        def load(cost: int):
+            with scheduler.admit(cost):
+                order.append(cost)
+
+        with scheduler.admit(100 * MB):
+            threads = []
+            for cost in [80 * MB, 60 * MB, 70 * MB]:
+                thread = threading.Thread(target=load, args=(cost,))
+                thread.start()
+                threads.append(thread)
+                while scheduler.stats()["queue_depth"] < len(threads):
+                    time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([60 * MB, 70 * MB, 80 * MB], order)
+        stats = scheduler.stats()
+        self.assertEqual(3, stats["queued"])
+        self.assertGreater(stats["wait_time_max"], 0.0)
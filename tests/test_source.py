@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from grafener.source import DirectorySource, LocalFilesystemSource, Source
+
+OUT_COL = "Environment:Site Outdoor Air Drybulb Temperature [C](TimeStep)"
+MTR_COL = "NaturalGas:Facility [J](Hourly)"
+
+
+def make_run_dir() -> str:
+    """Creates an EnergyPlus-like run directory with eplusout, eplusmtr and a tabular report."""
+    run_dir = tempfile.mkdtemp()
+    shutil.copy("tests/test_eplusout.csv.gz", os.path.join(run_dir, "eplusout.csv.gz"))
+    with open(os.path.join(run_dir, "eplusmtr.csv"), "w") as f:
+        f.write(f"Date/Time,Electricity:Facility [J](Hourly),{MTR_COL} \n")
+        for hour in range(1, 25):
+            f.write(f" 01/01  {hour:02d}:00:00,{hour * 10.0},{hour * 100.0}\n")
+    with open(os.path.join(run_dir, "eplustbl.csv"), "w") as f:
+        f.write("Program Version:,EnergyPlus\nTabular Output Report in Format: ,Comma\n")
+    return run_dir
+
+
+class TestFileSource(unittest.TestCase):
+    def test_estimate_load_size(self):
+        source = Source.of("tests/test_eplusout.csv.gz", 2020)
+        cols = list(source.read_source(header_only=True, use_cols=None).columns)
+        full_size = source.estimate_load_size(cols)
+        self.assertGreater(full_size, source.source_size())
+        self.assertAlmostEqual(full_size / len(cols), source.estimate_load_size(cols[:1]), delta=1)
+
+    def test_estimate_load_size_reads_header_once(self):
+        source = LocalFilesystemSource("tests/test_eplusout.csv.gz", 2020)
+        with patch.object(LocalFilesystemSource, "load", autospec=True, return_value=source.source_path) as load:
+            source.read_source(header_only=True, use_cols=None)
+            source.estimate_load_size([OUT_COL])
+            source.estimate_load_size([OUT_COL, MTR_COL])
+        self.assertEqual(1, load.call_count)
+
+
+class TestDirectorySource(unittest.TestCase):
+    def setUp(self):
+        self.run_dir = make_run_dir()
+
+    def tearDown(self):
+        shutil.rmtree(self.run_dir)
+
+    def test_of_directory(self):
+        self.assertIsInstance(Source.of(self.run_dir, 2020), DirectorySource)
+
+    def test_columns_index(self):
+        source = DirectorySource(self.run_dir, 2020)
+        self.assertEqual(os.path.join(self.run_dir, "eplusout.csv.gz"), source.columns_index[OUT_COL][0])
+        self.assertEqual((os.path.join(self.run_dir, "eplusmtr.csv"), f"{MTR_COL} "), source.columns_index[MTR_COL])
+        # column present in both files is read from eplusout
+        self.assertIn("eplusout", source.columns_index["Electricity:Facility [J](Hourly)"][0])
+        self.assertNotIn("eplustbl.csv", {os.path.basename(f) for f, _ in source.columns_index.values()})
+        self.assertNotIn("Date/Time", source.columns_index)
+
+    def test_header_only(self):
+        cols = DirectorySource(self.run_dir, 2020).read_source(header_only=True, use_cols=None).columns
+        self.assertEqual("Date/Time", cols[0])
+        self.assertIn(OUT_COL, cols)
+        self.assertIn(MTR_COL, cols)
+
+    def test_read_joins_files(self):
+        df = DirectorySource(self.run_dir, 2020).read_source(header_only=False, use_cols=[OUT_COL, MTR_COL])
+        self.assertCountEqual([OUT_COL, MTR_COL], df.columns)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertEqual(100.0, df.loc[pd.Timestamp("2020-01-01 01:00:00", tz="UTC"), MTR_COL])
+        self.assertFalse(df.isna().any().any())
+
+    def test_read_parses_only_needed_files(self):
+        source = DirectorySource(self.run_dir, 2020)
+        with patch.object(LocalFilesystemSource, "read_source", autospec=True) as read_source:
+            read_source.side_effect = lambda self_, header_only, use_cols: pd.DataFrame(
+                {"Date/Time": [0], **{c.strip(): [1.0] for c in use_cols}}
+            )
+            source.read_source(header_only=False, use_cols=[MTR_COL])
+        self.assertEqual(1, read_source.call_count)
+        self.assertEqual(os.path.join(self.run_dir, "eplusmtr.csv"), read_source.call_args[0][0].source_path)
+
+    def test_estimate_load_size_not_below_single_file(self):
+        gz_dir = tempfile.mkdtemp()
+        try:
+            shutil.copy("tests/test_eplusout.csv.gz", os.path.join(gz_dir, "eplusout.csv.gz"))
+            file_source = Source.of("tests/test_eplusout.csv.gz", 2020)
+            dir_source = Source.of(gz_dir, 2020)
+            for cols in [[OUT_COL], list(dir_source.columns_index.keys())]:
+                self.assertGreaterEqual(dir_source.estimate_load_size(cols), file_source.estimate_load_size(cols))
+        finally:
+            shutil.rmtree(gz_dir)
+
+    def test_estimate_load_size_only_needed_files(self):
+        source = DirectorySource(self.run_dir, 2020)
+        mtr_file = os.path.join(self.run_dir, "eplusmtr.csv")
+        self.assertEqual(
+            LocalFilesystemSource(mtr_file, 2020).estimate_load_size([MTR_COL]),
+            source.estimate_load_size([MTR_COL]),
+        )
+
+    def test_unreadable_files_ignored(self):
+        with open(os.path.join(self.run_dir, "eplusssz.csv.gz"), "wb") as f:
+            f.write(b"not a gzip file")
+        with open(os.path.join(self.run_dir, "epluszsz.csv.gz"), "wb") as f:
+            with open("tests/test_eplusout.csv.gz", "rb") as gz:
+                f.write(gz.read()[:50])
+        source = Source.of(self.run_dir, 2020)
+        self.assertIn(OUT_COL, source.columns_index)
+        self.assertIn(MTR_COL, source.columns_index)
+
+    def test_read_unknown_column(self):
+        with self.assertRaises(KeyError):
+            DirectorySource(self.run_dir, 2020).read_source(header_only=False, use_cols=["foo"])